@@ -353,7 +353,9 @@ def generate_graham_output(
             ),
         ])
 
-        prompt = template.invoke({"analysis_data": json.dumps(analysis_data, indent=2), "ticker": ticker})
+        # Compact, sorted serialization keeps the prompt token count down and
+        # makes the prefix deterministic for prompt caching.
+        prompt = template.invoke({"analysis_data": json.dumps(analysis_data, separators=(",", ":"), sort_keys=True, default=str), "ticker": ticker})
 
         response = llm.with_structured_output(AnalystReport).invoke(prompt)
         logger.info(f"Successfully generated Graham output for {ticker}") # Add logging
@@ -5,4 +5,9 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-llm = init_chat_model(model="gemini-2.0-flash", model_provider='google_genai', temperature=0)
\ No newline at end of file
+def get_llm():
+    """Build the chat model client. Use this factory (instead of the module-level
+    `llm`) when the caller wants to control caching/reuse of the client."""
+    return init_chat_model(model="gemini-2.0-flash", model_provider='google_genai', temperature=0)
+
+llm = get_llm()
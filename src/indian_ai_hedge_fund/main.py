@@ -123,6 +123,9 @@ def main():
             else:
                  logger.warning(f"Holdings data is not a list or DataFrame: {type(holdings_data)}")
 
+            # Format holdings once up front; reused later for the synthesis prompt.
+            formatted_holdings = format_holdings_for_prompt(holdings_df if holdings_df is not None else holdings_data)
+
         except Exception as e:
             logger.error(f"Failed to fetch or process holdings: {e}")
             console.print(f"\n[red bold]Error fetching holdings:[/red bold] {str(e)}")
@@ -221,8 +224,7 @@ def main():
         # 5. Prepare data for LLM
         logger.info("Preparing final prompt for LLM synthesis")
 
-        # Format holdings using the utility function and add heading
-        formatted_holdings = format_holdings_for_prompt(holdings_df if holdings_df is not None else holdings_data)
+        # Use the holdings string formatted right after fetch and add heading
         holdings_str = f"## Holdings\n\n{formatted_holdings}"
         logger.debug(f"Formatted holdings string for prompt:\n{holdings_str}")
 
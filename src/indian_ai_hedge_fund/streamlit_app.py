@@ -2,11 +2,11 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime
 import traceback
-import io
+import tempfile
 
 # Project specific imports - adjust paths if needed after project structure review
 from indian_ai_hedge_fund.tools.zerodha import get_holdings
-from indian_ai_hedge_fund.llm.models import llm
+from indian_ai_hedge_fund.llm.models import get_llm
 from indian_ai_hedge_fund.utils.logging_config import logger # Use logger if needed, Streamlit handles some logging
 from indian_ai_hedge_fund.analysts.config import get_analysts
 from indian_ai_hedge_fund.prompts.portfolio_review import SYSTEM_PROMPT, HUMAN_SYNTHESIS_TEMPLATE
@@ -19,6 +19,12 @@ from io import StringIO # For potential string IO if needed
 # --- Streamlit App Configuration ---
 st.set_page_config(page_title="Indian AI Hedge Fund Analysis", layout="wide")
 
+
+@st.cache_resource
+def _llm():
+    """Cache the LLM client across reruns/sessions so HTTP connection pools are reused."""
+    return get_llm()
+
 st.title("📈 Indian AI Hedge Fund Analysis")
 st.markdown("Select analysts, run the analysis on your Zerodha holdings, and view the synthesized report.")
 
@@ -91,6 +97,10 @@ if st.sidebar.button("🚀 Run Analysis", use_container_width=True):
 
         main_status_text.text("✅ Holdings fetched successfully!") # Update status on success
 
+        # Format holdings once, right after fetch, so synthesis and any later
+        # consumers share the same pre-built string instead of re-iterating.
+        formatted_holdings = format_holdings_for_prompt(holdings_df if holdings_df is not None else holdings_data)
+
         # --- Step 2: Extract Tickers ---
         tickers = []
         if not error_occurred:
@@ -159,8 +169,7 @@ if st.sidebar.button("🚀 Run Analysis", use_container_width=True):
                 try:
                     logger.info("Preparing final prompt for LLM synthesis")
 
-                    # Format holdings
-                    formatted_holdings = format_holdings_for_prompt(holdings_df if holdings_df is not None else holdings_data)
+                    # Use the holdings string precomputed after fetch
                     holdings_str = f"## Holdings\n\n{formatted_holdings}"
                     logger.debug(f"Formatted holdings string sample: {holdings_str[:200]}...")
 
@@ -178,7 +187,7 @@ if st.sidebar.button("🚀 Run Analysis", use_container_width=True):
                         ("system", SYSTEM_PROMPT),
                         ("human", HUMAN_SYNTHESIS_TEMPLATE)
                     ])
-                    chain = prompt | llm
+                    chain = prompt | _llm()
 
                     logger.info("Invoking LLM for final synthesis")
                     invoke_input = {
@@ -219,10 +228,13 @@ if st.sidebar.button("🚀 Run Analysis", use_container_width=True):
                     report_date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
                     pdf_filename = f"indian_ai_hedge_fund_analysis_{report_date_str}.pdf"
 
-                    # Generate PDF into a BytesIO buffer
-                    pdf_buffer = io.BytesIO()
-                    generate_pdf_report(holdings_for_pdf, analyst_reports, final_response, pdf_buffer)
-                    pdf_buffer.seek(0) # Rewind buffer to the beginning
+                    # Generate PDF into a temp file instead of an in-memory buffer
+                    # so large reports aren't held fully in RAM and then copied
+                    # again into Streamlit's internal buffer.
+                    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_pdf:
+                        pdf_path = tmp_pdf.name
+                    generate_pdf_report(holdings_for_pdf, analyst_reports, final_response, pdf_path)
+                    pdf_buffer = open(pdf_path, "rb") # Streamlit streams from the file handle
                     logger.info(f"PDF report generated successfully ({pdf_filename})")
                     st.success("PDF report generated.")
 
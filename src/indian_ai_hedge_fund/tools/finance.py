@@ -1,14 +1,200 @@
 import yfinance as yf
-from pydantic import BaseModel
+from pydantic import TypeAdapter
+import asyncio
+import dataclasses
 import datetime
+import functools
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import requests
 from indian_ai_hedge_fund.utils.logging_config import logger
 import warnings
+import numpy as np
 import pandas as pd
 
 # Suppress specific FutureWarnings from yfinance
 warnings.filterwarnings("ignore", category=FutureWarning, module='yfinance.utils')
 
-class FinancialMetrics(BaseModel):
+__all__ = [
+    "FinancialMetrics",
+    "get_latest_financial_metrics",
+    "get_latest_financial_metrics_async",
+    "get_latest_financial_metrics_bulk",
+    "get_historical_financial_metrics",
+    "get_historical_financial_metrics_arrow",
+]
+
+# Shared executor for overlapping the independent statement/info requests per
+# ticker. These are pure I/O (blocking HTTP), so four threads let the slowest
+# request bound the wall time instead of the sum of all four.
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+try:
+    import orjson  # Optional: much faster decode of the multi-KB .info JSON payloads
+except ImportError:
+    orjson = None
+
+
+def _build_yf_session() -> requests.Session:
+    """One shared session for every yfinance request: connections (and TLS
+    handshakes) are pooled across tickers, and when orjson is installed a
+    response hook swaps in its decoder for the large JSON payloads."""
+    session = requests.Session()
+    if orjson is not None:
+        def _use_orjson(response, **kwargs):
+            # Instance attribute shadows Response.json for this response only.
+            response.json = lambda **_: orjson.loads(response.content)
+            return response
+        session.hooks["response"].append(_use_orjson)
+    return session
+
+
+_YF_SESSION = _build_yf_session()
+
+
+@functools.lru_cache(maxsize=256)
+def _ticker(ticker_symbol: str) -> yf.Ticker:
+    """Memoized yf.Ticker construction so the latest and historical fetches for
+    the same symbol share one object (and its internal per-Ticker caching)."""
+    return yf.Ticker(ticker_symbol, session=_YF_SESSION)
+
+
+# Canonical keys matched (case-insensitively, as substrings) against statement
+# row labels. One compiled alternation per statement lets a single pass over
+# the index resolve every key instead of one scan per key; yfinance uses
+# spaced labels for the latest statements and CamelCase for the yearly ones.
+_LATEST_IS_KEYS = ("Net Income", "Net Income From Continuing Operations")
+_LATEST_BS_KEYS = ("Total Assets", "Total Liab", "Current Assets", "Current Liabilities", "Long Term Debt")
+_LATEST_CF_KEYS = ("Capital Expenditure", "Depreciation And Amortization", "Cash Dividends Paid", "Issuance Of Capital Stock")
+_HIST_IS_KEYS = ("NetIncome", "NetIncomeContinuousOperations")
+_HIST_BS_KEYS = ("TotalAssets", "TotalLiab", "TotalLiabilities", "TotalLiabilitiesNetMinorityInterest", "CurrentAssets", "CurrentLiabilities", "LongTermDebt")
+_HIST_CF_KEYS = ("CapitalExpenditure", "DepreciationAndAmortization", "CashDividendsPaid")
+
+
+# Yahoo exchange suffixes, shared by every entry point that normalizes symbols
+_NS = ".NS"
+_BO = ".BO"
+_YAHOO_SUFFIXES = (_NS, _BO)
+
+
+def _normalize_symbol(ticker_symbol: str, suffix: str = _NS) -> str:
+    """Append a Yahoo exchange suffix unless the symbol already carries one.
+    Plain concat keeps the common already-suffixed case allocation-free."""
+    return ticker_symbol if ticker_symbol.endswith(_YAHOO_SUFFIXES) else ticker_symbol + suffix
+
+
+def _key_pattern(keys: tuple[str, ...]) -> re.Pattern:
+    return re.compile("|".join(re.escape(k.lower()) for k in keys))
+
+
+_LATEST_IS_PATTERN = _key_pattern(_LATEST_IS_KEYS)
+_LATEST_BS_PATTERN = _key_pattern(_LATEST_BS_KEYS)
+_LATEST_CF_PATTERN = _key_pattern(_LATEST_CF_KEYS)
+_HIST_IS_PATTERN = _key_pattern(_HIST_IS_KEYS)
+_HIST_BS_PATTERN = _key_pattern(_HIST_BS_KEYS)
+_HIST_CF_PATTERN = _key_pattern(_HIST_CF_KEYS)
+
+
+def _match_statement_keys(index, pattern: re.Pattern, keys: tuple[str, ...]) -> dict[str, int]:
+    """Map each lowered key to the first row position whose label contains it.
+
+    Runs a single pass over the statement index; the compiled alternation acts
+    as a prefilter so labels matching no key are rejected in one C-level scan,
+    and the per-key substring check only runs on labels that hit the pattern.
+    """
+    keys_l = [k.lower() for k in keys]
+    mapping: dict[str, int] = {}
+    # Lower the whole index in one vectorized pandas call instead of one
+    # Python-level str.lower() per label
+    for pos, low in enumerate(index.str.lower()):
+        if pattern.search(low):
+            for key_l in keys_l:
+                if key_l in low and key_l not in mapping:
+                    mapping[key_l] = pos
+    return mapping
+
+
+# Resolved key->row-position maps per (symbol, statement). A symbol's
+# statement row layout doesn't change between calls in a session, so repeat
+# fetches (latest + historical, or re-analyses) skip the substring matching.
+_key_map_cache: dict[tuple[str, str], tuple[int, dict[str, int]]] = {}
+
+
+def _statement_key_map(ticker_symbol: str, statement: str, index, pattern: re.Pattern, keys: tuple[str, ...]) -> dict[str, int]:
+    """Memoized _match_statement_keys keyed by (symbol, statement kind).
+
+    The row count is stored alongside the mapping as a cheap staleness check
+    in case yfinance returns a reshaped statement."""
+    cache_key = (ticker_symbol, statement)
+    cached = _key_map_cache.get(cache_key)
+    if cached is not None and cached[0] == len(index):
+        return cached[1]
+    mapping = _match_statement_keys(index, pattern, keys)
+    _key_map_cache[cache_key] = (len(index), mapping)
+    return mapping
+
+
+def _fast_info_fields(ticker: yf.Ticker) -> dict:
+    """Pull the lightweight quote fields from ticker.fast_info.
+
+    fast_info hits a much smaller endpoint than the full quoteSummary behind
+    .info, and its values are fresher. Missing fields raise inside yfinance,
+    so each one is fetched defensively; callers fall back to .info (which is
+    still needed for operatingMargins) for anything absent here."""
+    fields = {}
+    try:
+        fast_info = ticker.fast_info
+        for name in ("shares", "last_price", "previous_close", "market_cap"):
+            try:
+                fields[name] = fast_info[name]
+            except Exception:
+                pass
+    except Exception as e:
+        logger.debug(f"fast_info unavailable for {ticker.ticker}: {e}")
+    return fields
+
+
+def _to_float_array(values) -> np.ndarray:
+    """Convert a list of period values (with None for gaps) to a float64 array with NaN gaps."""
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+
+def _nan_to_none(value: float) -> float | None:
+    """Map NaN back to None for the Optional[float] model fields."""
+    return None if np.isnan(value) else float(value)
+
+
+def _compute_ratios(ta, tl, ca, cl, ni, shares):
+    """Vectorized derived-ratio kernel over aligned period arrays.
+
+    Accepts 1-D (periods,) arrays for a single ticker and works unchanged on
+    2-D (tickers x periods) batches for portfolio-wide scans. Kept as pure
+    NumPy since numba is not a project dependency; the body is already in the
+    shape an @njit wrapper would accept should one ever be added.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        se = ta - tl
+        roe = ni / np.where(se != 0, se, np.nan)
+        de = tl / np.where(se != 0, se, np.nan)
+        cr = ca / np.where(cl != 0, cl, np.nan)
+        wc = ca - cl
+        if shares:
+            eps = ni / shares
+            bvps = se / shares
+        else:
+            eps = np.full_like(ni, np.nan)
+            bvps = np.full_like(se, np.nan)
+    return se, roe, de, cr, wc, eps, bvps
+
+
+# A slotted dataclass rather than a pydantic BaseModel: instances are built
+# per period in the historical loop from already-typed yfinance values, so
+# validation adds no safety, and __slots__ keeps the per-instance footprint
+# small. The model_* shims preserve the pydantic surface used elsewhere.
+@dataclasses.dataclass(slots=True)
+class FinancialMetrics:
     capital_expenditure: float | None = None
     depreciation_and_amortization: float | None = None
     net_income: float | None = None
@@ -33,49 +219,121 @@ class FinancialMetrics(BaseModel):
     current_assets: float | None = None
     current_liabilities: float | None = None
 
-def _fetch_and_calculate_latest_metrics(ticker_symbol: str) -> FinancialMetrics | None:
-    """Helper function to fetch and calculate latest metrics for a given ticker symbol."""
+    def model_dump(self) -> dict:
+        return dataclasses.asdict(self)
+
+    def model_dump_json(self) -> str:
+        return _FINANCIAL_METRICS_ADAPTER.dump_json(self).decode()
+
+    @classmethod
+    def model_validate_json(cls, data) -> "FinancialMetrics":
+        return _FINANCIAL_METRICS_ADAPTER.validate_json(data)
+
+
+_FINANCIAL_METRICS_ADAPTER = TypeAdapter(FinancialMetrics)
+
+# Filesystem cache for fetched metrics. Annual statements don't change within
+# a trading day, so entries are keyed by (symbol, today's date[, periods]) and
+# naturally expire at the next calendar day. Set IAIHF_DISABLE_METRICS_CACHE=1
+# to bypass the cache entirely.
+_METRICS_CACHE_DIR = Path.home() / ".cache" / "indian-ai-hedge-fund" / "metrics"
+_METRICS_CACHE_DISABLED = os.getenv("IAIHF_DISABLE_METRICS_CACHE", "").lower() in ("1", "true", "yes")
+
+_HISTORICAL_METRICS_ADAPTER = TypeAdapter(list[FinancialMetrics])
+
+
+def _metrics_cache_path(kind: str, ticker_symbol: str, *extra) -> Path:
+    parts = [kind, ticker_symbol, datetime.date.today().isoformat(), *map(str, extra)]
+    return _METRICS_CACHE_DIR / ("_".join(parts) + ".json")
+
+
+def _metrics_cache_read(path: Path) -> bytes | None:
+    if _METRICS_CACHE_DISABLED:
+        return None
     try:
-        ticker = yf.Ticker(ticker_symbol)
-        income_stmt = ticker.financials
-        balance_sheet = ticker.balance_sheet
-        cashflow = ticker.cashflow
-        info = ticker.info
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Could not read metrics cache {path}: {e}")
+        return None
+
+
+def _metrics_cache_write(path: Path, payload: bytes):
+    if _METRICS_CACHE_DISABLED:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(payload)
+    except Exception as e:
+        logger.debug(f"Could not write metrics cache {path}: {e}")
+
+
+def _fetch_and_calculate_latest_metrics(ticker_symbol: str, ticker: yf.Ticker | None = None) -> FinancialMetrics | None:
+    """Helper function to fetch and calculate latest metrics for a given ticker symbol.
+
+    An already-constructed yf.Ticker (e.g. from a yf.Tickers batch) can be passed
+    in to reuse its session instead of building a fresh one.
+    """
+    cache_path = _metrics_cache_path("latest", ticker_symbol)
+    cached = _metrics_cache_read(cache_path)
+    if cached is not None:
+        try:
+            return FinancialMetrics.model_validate_json(cached)
+        except Exception as e:
+            logger.debug(f"Invalid cached metrics for {ticker_symbol}, refetching: {e}")
+
+    try:
+        if ticker is None:
+            ticker = _ticker(ticker_symbol)
+
+        # Fetch the four independent payloads concurrently
+        f_is = _FETCH_EXECUTOR.submit(lambda: ticker.financials)
+        f_bs = _FETCH_EXECUTOR.submit(lambda: ticker.balance_sheet)
+        f_cf = _FETCH_EXECUTOR.submit(lambda: ticker.cashflow)
+        f_info = _FETCH_EXECUTOR.submit(lambda: ticker.info)
+        income_stmt, balance_sheet, cashflow, info = f_is.result(), f_bs.result(), f_cf.result(), f_info.result()
+
+        # Snapshot into a plain dict so later .get() calls can never trigger a
+        # lazy re-fetch through yfinance internals
+        info = dict(info or {})
+        fast_fields = _fast_info_fields(ticker)
 
         # Check if dataframes are empty or malformed
         if income_stmt.empty or balance_sheet.empty or cashflow.empty or not info:
              logger.warning(f"Incomplete data received for ticker: {ticker_symbol}")
              return None
 
-        def safe_get(df, key):
-            if df.empty:
+        # Resolve every key to its row position, cached per symbol/statement
+        is_map = _statement_key_map(ticker_symbol, "latest_is", income_stmt.index, _LATEST_IS_PATTERN, _LATEST_IS_KEYS)
+        bs_map = _statement_key_map(ticker_symbol, "latest_bs", balance_sheet.index, _LATEST_BS_PATTERN, _LATEST_BS_KEYS)
+        cf_map = _statement_key_map(ticker_symbol, "latest_cf", cashflow.index, _LATEST_CF_PATTERN, _LATEST_CF_KEYS)
+
+        def safe_get(df, mapping, key):
+            pos = mapping.get(key.lower())
+            if pos is None:
+                return None
+            try:
+                # Scalar positional access: skips the intermediate row Series
+                # that df.iloc[pos] would build just to take its first element
+                return df.iat[pos, 0]
+            except IndexError:
+                logger.warning(f"IndexError accessing {key} for {ticker_symbol}. Data shape: {df.shape}")
                 return None
-            for idx in df.index:
-                if key.lower() in idx.lower():
-                    try:
-                        # Handle potential MultiIndex or Series issues
-                        if isinstance(df.loc[idx], pd.Series):
-                           return df.loc[idx].iloc[0]
-                        else:
-                           return df.loc[idx]
-                    except IndexError:
-                        logger.warning(f"IndexError accessing {key} for {ticker_symbol}. Data shape: {df.loc[idx].shape}")
-                        return None
-                    except Exception as e:
-                        logger.warning(f"Unexpected error accessing {key} for {ticker_symbol}: {e}")
-                        return None
-            return None
-
-        net_income = safe_get(income_stmt, "Net Income") or safe_get(income_stmt, "Net Income From Continuing Operations")
-        total_assets = safe_get(balance_sheet, "Total Assets")
-        total_liabilities = safe_get(balance_sheet, "Total Liab")
-        current_assets = safe_get(balance_sheet, "Current Assets")
-        current_liabilities = safe_get(balance_sheet, "Current Liabilities")
-        long_term_debt = safe_get(balance_sheet, "Long Term Debt")
+            except Exception as e:
+                logger.warning(f"Unexpected error accessing {key} for {ticker_symbol}: {e}")
+                return None
+
+        net_income = safe_get(income_stmt, is_map, "Net Income") or safe_get(income_stmt, is_map, "Net Income From Continuing Operations")
+        total_assets = safe_get(balance_sheet, bs_map, "Total Assets")
+        total_liabilities = safe_get(balance_sheet, bs_map, "Total Liab")
+        current_assets = safe_get(balance_sheet, bs_map, "Current Assets")
+        current_liabilities = safe_get(balance_sheet, bs_map, "Current Liabilities")
+        long_term_debt = safe_get(balance_sheet, bs_map, "Long Term Debt")
         working_capital = current_assets - current_liabilities if current_assets is not None and current_liabilities is not None else None
 
-        # Calculate per share metrics
-        shares = info.get("sharesOutstanding")
+        # Calculate per share metrics (prefer fast_info, fall back to .info)
+        shares = fast_fields.get("shares") or info.get("sharesOutstanding")
         if shares is None or shares == 0:
              logger.warning(f"Shares outstanding not available or zero for {ticker_symbol}")
              shares = None # Ensure shares is None if invalid
@@ -86,7 +344,7 @@ def _fetch_and_calculate_latest_metrics(ticker_symbol: str) -> FinancialMetrics
 
 
         # Calculate price ratios
-        price = info.get("currentPrice") or info.get("previousClose") # Use previous close as fallback
+        price = fast_fields.get("last_price") or info.get("currentPrice") or fast_fields.get("previous_close") or info.get("previousClose") # Use previous close as fallback
         if price is None:
             logger.warning(f"Current price not available for {ticker_symbol}")
 
@@ -97,17 +355,17 @@ def _fetch_and_calculate_latest_metrics(ticker_symbol: str) -> FinancialMetrics
         return_on_equity = (net_income / book_value) if net_income is not None and book_value is not None and book_value != 0 else None
         debt_to_equity_ratio = (total_liabilities / book_value) if total_liabilities is not None and book_value is not None and book_value != 0 else None
         current_ratio = (current_assets / current_liabilities) if current_assets is not None and current_liabilities is not None and current_liabilities != 0 else None
-        operating_margin = info.get("operatingMargins")  # Already in decimal
-        market_cap = info.get("marketCap")
+        operating_margin = info.get("operatingMargins")  # Already in decimal; not exposed by fast_info
+        market_cap = fast_fields.get("market_cap") or info.get("marketCap")
 
         # Cashflow items
-        capital_expenditure = safe_get(cashflow, "Capital Expenditure")
-        depreciation_and_amortization = safe_get(cashflow, "Depreciation And Amortization")
-        dividends_paid = safe_get(cashflow, "Cash Dividends Paid")
-        issuance_stock = safe_get(cashflow, "Issuance Of Capital Stock")
+        capital_expenditure = safe_get(cashflow, cf_map, "Capital Expenditure")
+        depreciation_and_amortization = safe_get(cashflow, cf_map, "Depreciation And Amortization")
+        dividends_paid = safe_get(cashflow, cf_map, "Cash Dividends Paid")
+        issuance_stock = safe_get(cashflow, cf_map, "Issuance Of Capital Stock")
 
 
-        return FinancialMetrics(
+        metrics = FinancialMetrics(
             capital_expenditure=capital_expenditure,
             depreciation_and_amortization=depreciation_and_amortization,
             net_income=net_income,
@@ -131,6 +389,8 @@ def _fetch_and_calculate_latest_metrics(ticker_symbol: str) -> FinancialMetrics
             current_assets=current_assets,
             current_liabilities=current_liabilities
         )
+        _metrics_cache_write(cache_path, metrics.model_dump_json().encode())
+        return metrics
     except Exception as e:
         logger.error(f"Error fetching or processing latest data for {ticker_symbol}: {e}")
         return None
@@ -141,11 +401,8 @@ def get_latest_financial_metrics(ticker_symbol: str) -> FinancialMetrics | None:
     Fetches the latest available financial metrics for a given stock ticker.
     Tries with .NS (NSE) suffix first, then .BO (BSE) if .NS fails.
     """
-    # Try with .NS suffix
-    if not ticker_symbol.endswith((".NS", ".BO")):
-        ticker_ns = f"{ticker_symbol}.NS"
-    else:
-        ticker_ns = ticker_symbol # Assume provided suffix is intended
+    # Try with .NS suffix (a provided suffix is assumed to be intended)
+    ticker_ns = _normalize_symbol(ticker_symbol)
 
     logger.info(f"Attempting to fetch latest data for {ticker_ns}")
     metrics = _fetch_and_calculate_latest_metrics(ticker_ns)
@@ -154,8 +411,8 @@ def get_latest_financial_metrics(ticker_symbol: str) -> FinancialMetrics | None:
         return metrics
 
     # If .NS failed or returned None, and the original didn't end with .BO, try .BO
-    if not ticker_symbol.endswith(".BO"):
-        ticker_bo = f"{ticker_symbol}.BO"
+    if not ticker_symbol.endswith(_BO):
+        ticker_bo = ticker_symbol + _BO
         logger.info(f"Fetching with {ticker_ns} failed or returned no data, trying {ticker_bo}")
         metrics = _fetch_and_calculate_latest_metrics(ticker_bo)
         if metrics:
@@ -165,17 +422,102 @@ def get_latest_financial_metrics(ticker_symbol: str) -> FinancialMetrics | None:
     return None
 
 
+async def get_latest_financial_metrics_async(ticker_symbol: str) -> FinancialMetrics | None:
+    """
+    Async variant of get_latest_financial_metrics that races the .NS and .BO
+    fetches concurrently and returns the first valid result, instead of
+    waiting for the .NS attempt to fail before starting the .BO one. Halves
+    the worst-case latency for BSE-only listings.
+    """
+    if ticker_symbol.endswith(_YAHOO_SUFFIXES):
+        return await asyncio.to_thread(_fetch_and_calculate_latest_metrics, ticker_symbol)
+
+    tasks = [
+        asyncio.create_task(
+            asyncio.to_thread(_fetch_and_calculate_latest_metrics, ticker_symbol + suffix)
+        )
+        for suffix in _YAHOO_SUFFIXES
+    ]
+    metrics = None
+    try:
+        for future in asyncio.as_completed(tasks):
+            result = await future
+            if result is not None:
+                metrics = result
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    if metrics is None:
+        logger.warning(f"Could not retrieve valid latest financial data for {ticker_symbol} using .NS or .BO.")
+    return metrics
+
+
+# Yahoo multi-symbol endpoints accept batches of ~20 symbols per request.
+_BULK_BATCH_SIZE = 20
+
+
+def get_latest_financial_metrics_bulk(ticker_symbols: list[str]) -> dict[str, FinancialMetrics | None]:
+    """
+    Fetches the latest financial metrics for multiple tickers using batched
+    yf.Tickers requests instead of one round of HTTP calls per symbol.
+    Symbols that return no data on the NSE (.NS) feed are retried together
+    as a second batch against the BSE (.BO) feed.
+    """
+    results: dict[str, FinancialMetrics | None] = {sym: None for sym in ticker_symbols}
+
+    def _run_batch(symbol_map: dict[str, str]):
+        # symbol_map maps the caller's symbol to the suffixed Yahoo symbol
+        items = list(symbol_map.items())
+        for start in range(0, len(items), _BULK_BATCH_SIZE):
+            chunk = items[start:start + _BULK_BATCH_SIZE]
+            batch = yf.Tickers(" ".join(yahoo_sym for _, yahoo_sym in chunk), session=_YF_SESSION)
+            for original, yahoo_sym in chunk:
+                ticker = batch.tickers.get(yahoo_sym.upper())
+                results[original] = _fetch_and_calculate_latest_metrics(yahoo_sym, ticker=ticker)
+
+    # First pass: NSE, unless the caller already provided an explicit suffix
+    _run_batch({sym: _normalize_symbol(sym) for sym in ticker_symbols})
+
+    # Second pass: retry the misses on the BSE feed
+    retry_map = {
+        sym: sym + _BO
+        for sym, metrics in results.items()
+        if metrics is None and not sym.endswith(_YAHOO_SUFFIXES)
+    }
+    if retry_map:
+        logger.info(f"Retrying {len(retry_map)} symbols on the .BO feed: {list(retry_map)}")
+        _run_batch(retry_map)
+
+    return results
+
+
 def _fetch_and_calculate_historical_metrics(ticker_symbol: str, periods: int = 5) -> list[FinancialMetrics]:
     """Helper function to fetch and calculate historical metrics for a given ticker symbol."""
+    cache_path = _metrics_cache_path("historical", ticker_symbol, periods)
+    cached = _metrics_cache_read(cache_path)
+    if cached is not None:
+        try:
+            return _HISTORICAL_METRICS_ADAPTER.validate_json(cached)
+        except Exception as e:
+            logger.debug(f"Invalid cached historical metrics for {ticker_symbol}, refetching: {e}")
+
     results = []
     try:
-        ticker = yf.Ticker(ticker_symbol)
+        ticker = _ticker(ticker_symbol)
+
+        # Get annual data, fetching the four independent payloads concurrently
+        f_is = _FETCH_EXECUTOR.submit(ticker.get_financials, freq="yearly")
+        f_bs = _FETCH_EXECUTOR.submit(ticker.get_balance_sheet, freq="yearly")
+        f_cf = _FETCH_EXECUTOR.submit(ticker.get_cashflow, freq="yearly")
+        f_info = _FETCH_EXECUTOR.submit(lambda: ticker.info)
+        income_stmt, balance_sheet, cashflow, info = f_is.result(), f_bs.result(), f_cf.result(), f_info.result()
 
-        # Get annual data
-        income_stmt = ticker.get_financials(freq="yearly")
-        balance_sheet = ticker.get_balance_sheet(freq="yearly")
-        cashflow = ticker.get_cashflow(freq="yearly")
-        info = ticker.info # Fetch info once
+        # Snapshot into a plain dict so later .get() calls can never trigger a
+        # lazy re-fetch through yfinance internals
+        info = dict(info or {})
+        fast_fields = _fast_info_fields(ticker)
 
         # Check for empty dataframes early
         if income_stmt.empty or balance_sheet.empty or cashflow.empty:
@@ -188,8 +530,10 @@ def _fetch_and_calculate_historical_metrics(ticker_symbol: str, periods: int = 5
         # logger.debug(f"Info for {ticker_symbol}: {info}") # Can be very verbose
 
 
-        # Ensure alignment and limit periods across all dataframes
-        common_cols = income_stmt.columns.intersection(balance_sheet.columns).intersection(cashflow.columns)
+        # Ensure alignment and limit periods across all dataframes. Plain set
+        # math avoids the intermediate pandas Index objects that chained
+        # .intersection() calls allocate.
+        common_cols = set(income_stmt.columns) & set(balance_sheet.columns) & set(cashflow.columns)
         common_cols = sorted(common_cols, reverse=True)[:periods] # Get latest 'periods' common columns
 
         if not common_cols:
@@ -201,135 +545,183 @@ def _fetch_and_calculate_historical_metrics(ticker_symbol: str, periods: int = 5
         cashflow = cashflow[common_cols]
 
 
-        def safe_get_hist(df, key):
-            if df.empty:
-                 return [None] * len(common_cols)
-            for idx in df.index:
-                if key.lower() in idx.lower():
-                     # Ensure the row exists for the common columns
-                     if idx in df.index:
-                         return df.loc[idx, common_cols].tolist()
-                     else:
-                         logger.warning(f"Key '{key}' (row '{idx}') not found in dataframe for {ticker_symbol} with common columns.")
-                         return [None] * len(common_cols)
+        # Resolve every key to its row position in a single pass per statement.
+        # The statements were already subset to common_cols above, so the row
+        # arrays pulled out of the ndarrays are aligned with the periods.
+        is_map = _statement_key_map(ticker_symbol, "hist_is", income_stmt.index, _HIST_IS_PATTERN, _HIST_IS_KEYS)
+        bs_map = _statement_key_map(ticker_symbol, "hist_bs", balance_sheet.index, _HIST_BS_PATTERN, _HIST_BS_KEYS)
+        cf_map = _statement_key_map(ticker_symbol, "hist_cf", cashflow.index, _HIST_CF_PATTERN, _HIST_CF_KEYS)
+
+        is_arr = income_stmt.to_numpy()
+        bs_arr = balance_sheet.to_numpy()
+        cf_arr = cashflow.to_numpy()
+
+        def safe_get_hist(arr, mapping, key):
+            pos = mapping.get(key.lower())
+            if pos is not None:
+                return arr[pos].tolist()
             logger.warning(f"Key '{key}' not found in index for {ticker_symbol}.")
             return [None] * len(common_cols)
 
+        def safe_get_hist_first_valid(arr, mapping, keys):
+            # NOTE: `safe_get_hist(...) or safe_get_hist(...)` cannot express
+            # this fallback — a row of all-None/NaN is a non-empty (truthy)
+            # list, so `or` never falls through. Check each candidate's values
+            # explicitly and return the first row with any real number.
+            for key in keys:
+                pos = mapping.get(key.lower())
+                if pos is None:
+                    continue
+                row = arr[pos].tolist()
+                if any(v is not None and v == v for v in row):  # v == v filters NaN
+                    return row
+            logger.warning(f"None of {keys} found with valid data in index for {ticker_symbol}.")
+            return [None] * len(common_cols)
+
 
         # Get metrics across all periods
-        net_income = safe_get_hist(income_stmt, "NetIncome") or safe_get_hist(income_stmt, "NetIncomeContinuousOperations")
-        total_assets = safe_get_hist(balance_sheet, "TotalAssets")
-        total_liabilities = safe_get_hist(balance_sheet, "TotalLiab") or safe_get_hist(balance_sheet, "TotalLiabilities") or safe_get_hist(balance_sheet, "TotalLiabilitiesNetMinorityInterest")
-        current_assets = safe_get_hist(balance_sheet, "CurrentAssets")
-        current_liabilities = safe_get_hist(balance_sheet, "CurrentLiabilities")
-        long_term_debt = safe_get_hist(balance_sheet, "LongTermDebt")
-        capital_expenditure = safe_get_hist(cashflow, "CapitalExpenditure")
-        depreciation = safe_get_hist(cashflow, "DepreciationAndAmortization")
-        dividends_paid = safe_get_hist(cashflow, "CashDividendsPaid")
-
-
-        shares = info.get("sharesOutstanding") # Use single value for historical calculations as well
+        net_income = safe_get_hist_first_valid(is_arr, is_map, ("NetIncome", "NetIncomeContinuousOperations"))
+        total_assets = safe_get_hist(bs_arr, bs_map, "TotalAssets")
+        total_liabilities = safe_get_hist_first_valid(bs_arr, bs_map, ("TotalLiab", "TotalLiabilities", "TotalLiabilitiesNetMinorityInterest"))
+        current_assets = safe_get_hist(bs_arr, bs_map, "CurrentAssets")
+        current_liabilities = safe_get_hist(bs_arr, bs_map, "CurrentLiabilities")
+        long_term_debt = safe_get_hist(bs_arr, bs_map, "LongTermDebt")
+        capital_expenditure = safe_get_hist(cf_arr, cf_map, "CapitalExpenditure")
+        depreciation = safe_get_hist(cf_arr, cf_map, "DepreciationAndAmortization")
+        dividends_paid = safe_get_hist(cf_arr, cf_map, "CashDividendsPaid")
+
+
+        # Hoist the handful of fast_info/info fields used below into locals
+        shares = fast_fields.get("shares") or info.get("sharesOutstanding") # Use single value for historical calculations as well
         if shares is None or shares == 0:
             logger.warning(f"Shares outstanding not available or zero for {ticker_symbol}, historical per-share metrics will be None.")
             shares = None
+        price = fast_fields.get("last_price") or info.get("currentPrice") or fast_fields.get("previous_close") or info.get("previousClose") # Use previous close as fallback
+        operating_margin = info.get("operatingMargins")  # Not exposed by fast_info
+        market_cap = fast_fields.get("market_cap") or info.get("marketCap")
 
 
-        for i, period_ts in enumerate(common_cols):
-             # Calculate derived metrics for the specific period
-             ta = total_assets[i]
-             tl = total_liabilities[i]
-             ca = current_assets[i]
-             cl = current_liabilities[i]
-             ni = net_income[i]
-             ltd = long_term_debt[i]
-             capex = capital_expenditure[i]
-             depr = depreciation[i]
-             divp = dividends_paid[i]
-
-
-             se = ta - tl if ta is not None and tl is not None else None
-             roe = (ni / se) if ni is not None and se is not None and se != 0 else None
-             de = (tl / se) if tl is not None and se is not None and se != 0 else None
-             cr = (ca / cl) if ca is not None and cl is not None and cl != 0 else None
-             wc = ca - cl if ca is not None and cl is not None else None
-
-             # Calculate per share metrics
-             eps = ni / shares if ni is not None and shares is not None else None
-             bvps = se / shares if se is not None and shares is not None else None
+        # Compute the derived metrics vectorized over all periods at once.
+        # None becomes NaN so the arithmetic runs without per-value branching,
+        # then NaN maps back to None when assembling the models below.
+        ta = _to_float_array(total_assets)
+        tl = _to_float_array(total_liabilities)
+        ca = _to_float_array(current_assets)
+        cl = _to_float_array(current_liabilities)
+        ni = _to_float_array(net_income)
+
+        se, roe, de, cr, wc, eps, bvps = _compute_ratios(ta, tl, ca, cl, ni, shares)
 
+        for i, period_ts in enumerate(common_cols):
              # Convert pandas timestamp to datetime.datetime
              period_dt = period_ts.to_pydatetime() if hasattr(period_ts, 'to_pydatetime') else None
 
 
              results.append(FinancialMetrics(
                 period=period_dt,
-                capital_expenditure=capex,
-                depreciation_and_amortization=depr,
-                net_income=ni,
-                total_assets=ta,
-                total_liabilities=tl,
-                dividends_and_other_cash_distributions=divp, # Renamed field
+                capital_expenditure=capital_expenditure[i],
+                depreciation_and_amortization=depreciation[i],
+                net_income=_nan_to_none(ni[i]),
+                total_assets=_nan_to_none(ta[i]),
+                total_liabilities=_nan_to_none(tl[i]),
+                dividends_and_other_cash_distributions=dividends_paid[i], # Renamed field
                 # issuance_or_purchase_of_equity_shares= # Not reliably available in annual cashflow across periods easily
-                return_on_equity=roe,
-                debt_to_equity_ratio=de, # Renamed field
+                return_on_equity=_nan_to_none(roe[i]),
+                debt_to_equity_ratio=_nan_to_none(de[i]), # Renamed field
                 # operating_margin= # Not typically in annual historical financials this way
-                current_ratio=cr,
+                current_ratio=_nan_to_none(cr[i]),
                 # market_cap= # Market cap changes daily, not tied to annual report period
-                earnings_per_share=eps,
-                book_value_per_share=bvps,
+                earnings_per_share=_nan_to_none(eps[i]),
+                book_value_per_share=_nan_to_none(bvps[i]),
                 # price_to_earnings_ratio= # Needs price for that specific date, harder to get reliably
                 # price_to_book_ratio= # Needs price for that specific date
-                working_capital=wc,
-                long_term_debt=ltd,
-                current_assets=ca,
-                current_liabilities=cl,
+                working_capital=_nan_to_none(wc[i]),
+                long_term_debt=long_term_debt[i],
+                current_assets=_nan_to_none(ca[i]),
+                current_liabilities=_nan_to_none(cl[i]),
                 # outstanding_shares = shares # Add if needed, but it's constant across history here
              ))
 
         # Add latest market data to the most recent historical period's entry if available
         if results:
-             price = info.get("currentPrice") or info.get("previousClose")
              if price and results[0].earnings_per_share is not None and results[0].earnings_per_share != 0:
                  results[0].price_to_earnings_ratio = price / results[0].earnings_per_share
              if price and results[0].book_value_per_share is not None and results[0].book_value_per_share != 0:
                  results[0].price_to_book_ratio = price / results[0].book_value_per_share
 
              results[0].outstanding_shares = shares # Add latest shares outstanding
-             results[0].operating_margin = info.get("operatingMargins") # Add latest op margin
-             results[0].market_cap = info.get("marketCap") # Add latest market cap
+             results[0].operating_margin = operating_margin # Add latest op margin
+             results[0].market_cap = market_cap # Add latest market cap
 
 
     except Exception as e:
         logger.error(f"Error fetching or processing historical data for {ticker_symbol}: {e}")
         # results remains an empty list
 
+    if results:
+        _metrics_cache_write(cache_path, _HISTORICAL_METRICS_ADAPTER.dump_json(results))
+
     return results
 
 
-def get_historical_financial_metrics(ticker_symbol: str, periods: int = 5) -> list[FinancialMetrics]:
+def _metrics_to_frame(metrics_list: list[FinancialMetrics]) -> pd.DataFrame:
+    """Columnar (SoA) view of a metrics list: one column per field, indexed by
+    period, so downstream aggregations run vectorized instead of iterating
+    FinancialMetrics objects."""
+    if not metrics_list:
+        return pd.DataFrame()
+    columns = {
+        field.name: [getattr(m, field.name) for m in metrics_list]
+        for field in dataclasses.fields(FinancialMetrics)
+        if field.name != "period"
+    }
+    return pd.DataFrame(columns, index=pd.Index([m.period for m in metrics_list], name="period"))
+
+
+def get_historical_financial_metrics(ticker_symbol: str, periods: int = 5, as_frame: bool = False) -> list[FinancialMetrics] | pd.DataFrame:
     """
     Fetches historical annual financial metrics for a given stock ticker for the specified number of periods.
     Tries with .NS (NSE) suffix first, then .BO (BSE) if .NS fails.
+    Pass as_frame=True to get a columnar DataFrame (one column per metric,
+    indexed by period) instead of a list of FinancialMetrics objects.
     """
-    # Try with .NS suffix
-    if not ticker_symbol.endswith((".NS", ".BO")):
-        ticker_ns = f"{ticker_symbol}.NS"
-    else:
-        ticker_ns = ticker_symbol # Assume provided suffix is intended
+    # Try with .NS suffix (a provided suffix is assumed to be intended)
+    ticker_ns = _normalize_symbol(ticker_symbol)
 
     logger.info(f"Attempting to fetch historical data for {ticker_ns}")
     metrics_list = _fetch_and_calculate_historical_metrics(ticker_ns, periods)
 
     if metrics_list: # Check if list is not empty
-        return metrics_list
+        return _metrics_to_frame(metrics_list) if as_frame else metrics_list
 
     # If .NS failed or returned [], and the original didn't end with .BO, try .BO
-    if not ticker_symbol.endswith(".BO"):
-        ticker_bo = f"{ticker_symbol}.BO"
+    if not ticker_symbol.endswith(_BO):
+        ticker_bo = ticker_symbol + _BO
         logger.info(f"Fetching historical with {ticker_ns} failed or returned no data, trying {ticker_bo}")
         metrics_list = _fetch_and_calculate_historical_metrics(ticker_bo, periods)
         if metrics_list:
-            return metrics_list
+            return _metrics_to_frame(metrics_list) if as_frame else metrics_list
 
     logger.warning(f"Could not retrieve valid historical financial data for {ticker_symbol} using .NS or .BO.")
-    return [] # Return empty list if both fail
\ No newline at end of file
+    return pd.DataFrame() if as_frame else [] # Return empty result if both fail
+
+def get_historical_financial_metrics_arrow(ticker_symbol: str, periods: int = 5):
+    """
+    Like get_historical_financial_metrics, but returns a pyarrow.Table
+    (one column per metric plus a "period" column) for zero-copy handoff
+    to columnar consumers such as pandas, Polars or DuckDB.
+    Requires the optional pyarrow package.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("pyarrow is required for get_historical_financial_metrics_arrow; install it with 'pip install pyarrow'")
+
+    metrics_list = get_historical_financial_metrics(ticker_symbol, periods)
+    if not metrics_list:
+        return pa.table({})
+    columns = {
+        field.name: [getattr(m, field.name) for m in metrics_list]
+        for field in dataclasses.fields(FinancialMetrics)
+    }
+    return pa.table(columns)
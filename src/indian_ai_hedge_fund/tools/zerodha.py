@@ -1,15 +1,54 @@
 from kiteconnect import KiteConnect
 from dotenv import load_dotenv
+import json
 import os
+import time
+import numpy as np
 from indian_ai_hedge_fund.utils.logging_config import logger
 
+try:
+    import orjson  # Optional: much faster serialization for large payloads
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
+
+def _dumps(payload) -> str:
+    """Serialize an API payload to a JSON string (orjson when available).
+
+    Unlike str(), the output is valid JSON, so downstream consumers can parse
+    it back instead of relying on Python repr formatting."""
+    if orjson is not None:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload, default=str)
+
 api_key = os.getenv("KITE_API_KEY")
 api_secret = os.getenv("KITE_API_SECRET")
 access_token = os.getenv("KITE_ACCESS_TOKEN")
 
-kite = KiteConnect(api_key=api_key, access_token=access_token)
+# The pool kwarg makes kiteconnect mount an HTTPAdapter on its internal
+# requests session, so TCP/TLS connections are kept alive and reused across
+# calls instead of paying a fresh handshake per request.
+kite = KiteConnect(
+    api_key=api_key,
+    access_token=access_token,
+    pool={"pool_connections": 10, "pool_maxsize": 20, "max_retries": 3},
+)
+
+# Instrument dumps are large (~100k rows) and refreshed by Zerodha once a day,
+# so cache them per exchange instead of re-downloading the CSV on every call.
+_INSTRUMENTS_CACHE_TTL = 24 * 60 * 60  # seconds
+_instruments_cache: dict = {}  # exchange -> (fetch_time, instruments)
+
+# The profile is static per session and margins change slowly, yet agents tend
+# to re-request both every decision step. Short TTL caches turn those repeat
+# calls into dict lookups; the margins cache is flushed after order placement
+# since that is what actually moves the numbers.
+_PROFILE_CACHE_TTL = 60 * 60  # seconds
+_MARGINS_CACHE_TTL = 60  # seconds
+_profile_cache: dict = {}  # {"profile": (fetch_time, json_str)}
+_margins_cache: dict = {}  # segment -> (fetch_time, json_str)
 
 def get_user_profile() -> str:
     """Get the authenticated user's Zerodha profile information.
@@ -28,11 +67,19 @@ def get_user_profile() -> str:
         str: A string representation of the user's complete profile information from Zerodha
     """
     logger.info("Entering get_user_profile")
+    cached = _profile_cache.get("profile")
+    if cached is not None and time.time() - cached[0] < _PROFILE_CACHE_TTL:
+        logger.info("Returning cached profile")
+        return cached[1]
     # Get user profile
     profile = kite.profile()
-    logger.info(f"Profile: {profile}")
+    # Deferred template formatting: the payload is only stringified if a sink
+    # actually accepts DEBUG records
+    logger.debug("Profile: {}", profile)
     logger.info("Exiting get_user_profile")
-    return str(profile)
+    result = _dumps(profile)
+    _profile_cache["profile"] = (time.time(), result)
+    return result
 
 
 def get_margins(segment: str) -> str:
@@ -57,11 +104,17 @@ def get_margins(segment: str) -> str:
         str: A string representation of the complete margins and funds information
     """
     logger.info(f"Entering get_margins with segment: {segment}")
+    cached = _margins_cache.get(segment)
+    if cached is not None and time.time() - cached[0] < _MARGINS_CACHE_TTL:
+        logger.info(f"Returning cached margins for segment: {segment}")
+        return cached[1]
     # Get margins for all segments
     margins = kite.margins(segment=segment)
-    logger.info(f"Margins: {margins}")
+    logger.debug("Margins: {}", margins)
     logger.info("Exiting get_margins")
-    return str(margins)
+    result = _dumps(margins)
+    _margins_cache[segment] = (time.time(), result)
+    return result
 
 
 def get_holdings() -> str:
@@ -84,7 +137,8 @@ def get_holdings() -> str:
     """
     logger.info("Entering get_holdings")
     holdings = kite.holdings()
-    logger.info(f"Holdings: {holdings}")
+    logger.info(f"Fetched {len(holdings)} holdings")
+    logger.debug("Holdings: {}", holdings)
     logger.info("Exiting get_holdings")
     return holdings
 
@@ -110,12 +164,21 @@ def get_instruments(exchange: str = None) -> list:
         exchange (str, optional): Filter instruments by exchange (e.g., "NSE", "BSE", "NFO").
                                   If None, fetches instruments for all exchanges. Defaults to None.
 
+    Results are cached in-process for 24 hours per exchange (the instrument
+    dump only changes once a day), so repeated calls skip the multi-megabyte
+    CSV download. Callers should treat the returned list as read-only.
+
     Returns:
         list: A list of dictionaries, where each dictionary represents an instrument.
     """
     logger.info(f"Entering get_instruments with exchange: {exchange}")
+    cached = _instruments_cache.get(exchange)
+    if cached is not None and time.time() - cached[0] < _INSTRUMENTS_CACHE_TTL:
+        logger.info(f"Returning {len(cached[1])} cached instruments for exchange: {exchange or 'all'}.")
+        return cached[1]
     try:
         instruments = kite.instruments(exchange=exchange)
+        _instruments_cache[exchange] = (time.time(), instruments)
         logger.info(f"Successfully fetched {len(instruments)} instruments for exchange: {exchange or 'all'}.")
         logger.info("Exiting get_instruments")
         return instruments
@@ -160,6 +223,8 @@ def place_order(exchange: str, tradingsymbol: str, transaction_type: str,
             validity=validity
         )
         logger.info(f"Order placed successfully. Order ID: {order_id}")
+        # The order consumed margin, so cached margin figures are now stale
+        _margins_cache.clear()
         return str(order_id)
     except Exception as e:
         logger.exception(f"Error placing order: {str(e)}")
@@ -205,7 +270,7 @@ def get_historical_data(instrument_token: int, from_date: str, to_date: str, int
             oi=oi
         )
         logger.info(f"Successfully fetched historical data for instrument {instrument_token}.")
-        logger.debug(f"Historical data sample: {historical_data[:5]}") # Log a small sample
+        logger.debug("Historical data sample: {}", historical_data[:5]) # Log a small sample
         logger.info("Exiting get_historical_data")
         return historical_data
     except Exception as e:
@@ -213,6 +278,46 @@ def get_historical_data(instrument_token: int, from_date: str, to_date: str, int
         raise
 
 
+def get_historical_data_columns(instrument_token: int, from_date: str, to_date: str, interval: str, continuous: bool = False, oi: bool = False) -> dict[str, np.ndarray]:
+    """Fetch historical candles as a column-oriented dict of NumPy arrays.
+
+    Same parameters as get_historical_data, but instead of a list of candle
+    dicts this returns one array per field so downstream indicator code
+    (moving averages, RSI, etc.) can run vectorized without first converting
+    the candles itself.
+
+    Returns:
+        dict: {"timestamp": datetime64[s], "open": float64, "high": float64,
+               "low": float64, "close": float64, "volume": int64} arrays,
+               plus "oi" (int64) when oi=True. Arrays are empty if no candles
+               were returned.
+    """
+    candles = get_historical_data(instrument_token, from_date, to_date, interval, continuous, oi)
+    n = len(candles)
+    columns = {
+        "timestamp": np.empty(n, dtype="datetime64[s]"),
+        "open": np.empty(n, dtype=np.float64),
+        "high": np.empty(n, dtype=np.float64),
+        "low": np.empty(n, dtype=np.float64),
+        "close": np.empty(n, dtype=np.float64),
+        "volume": np.empty(n, dtype=np.int64),
+    }
+    if oi:
+        columns["oi"] = np.empty(n, dtype=np.int64)
+    for i, candle in enumerate(candles):
+        ts = candle["date"]
+        # Kite returns tz-aware datetimes; datetime64 needs them naive
+        columns["timestamp"][i] = ts.replace(tzinfo=None) if getattr(ts, "tzinfo", None) else ts
+        columns["open"][i] = candle["open"]
+        columns["high"][i] = candle["high"]
+        columns["low"][i] = candle["low"]
+        columns["close"][i] = candle["close"]
+        columns["volume"][i] = candle["volume"]
+        if oi:
+            columns["oi"][i] = candle.get("oi", 0)
+    return columns
+
+
 
 
 
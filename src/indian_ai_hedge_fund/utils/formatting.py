@@ -1,5 +1,4 @@
 import pandas as pd
-import json
 from typing import Any, List, Dict, Union
 from indian_ai_hedge_fund.analysts.models import AnalystReport
 from indian_ai_hedge_fund.utils.logging_config import logger
@@ -21,10 +20,28 @@ def format_holdings_for_prompt(holdings_data: Union[List[Dict[str, Any]], pd.Dat
     if holdings_data is None:
         return "Holdings data not available."
 
+    # Define the columns we want to display
+    required_columns = ['tradingsymbol', 'quantity', 'average_price', 'last_price', 'pnl']
+
     holdings_df = None
     if isinstance(holdings_data, list):
         if not holdings_data:
             return "Holdings portfolio is empty."
+        # Fast path: for a list of dicts, build the markdown table directly.
+        # Constructing a DataFrame (and routing through tabulate) just to
+        # print a handful of columns costs far more than a string join.
+        if isinstance(holdings_data[0], dict):
+            cols = [c for c in required_columns if c in holdings_data[0]]
+            if cols:
+                lines = [
+                    "| " + " | ".join(cols) + " |",
+                    "|" + "---|" * len(cols),
+                ]
+                lines.extend(
+                    "| " + " | ".join(str(row.get(c, "")) for c in cols) + " |"
+                    for row in holdings_data
+                )
+                return "Current Portfolio Holdings (Markdown):\n```\n" + "\n".join(lines) + "\n```"
         try:
             holdings_df = pd.DataFrame(holdings_data)
         except Exception as e:
@@ -37,8 +54,6 @@ def format_holdings_for_prompt(holdings_data: Union[List[Dict[str, Any]], pd.Dat
         # Fallback for unexpected types, return raw string representation
         return f"Current Portfolio Holdings (raw/unprocessed):\n```\n{str(holdings_data)}\n```"
 
-    # Define the columns we want to display
-    required_columns = ['tradingsymbol', 'quantity', 'average_price', 'last_price', 'pnl']
     available_columns = [col for col in required_columns if col in holdings_df.columns]
 
     if not available_columns:
@@ -60,13 +75,17 @@ def format_holdings_for_prompt(holdings_data: Union[List[Dict[str, Any]], pd.Dat
 
 def format_analyst_report_for_prompt(analyst_name: str, report: dict[str, AnalystReport]) -> str:
     try:
-        # Convert AnalystReport objects to dictionaries
-        serializable_report = {k: v.model_dump() for k, v in report.items()}
+        # Serialize each AnalystReport straight to JSON (model_dump_json fuses
+        # dump + encode in one pass) instead of building an intermediate dict
+        # tree and re-serializing it with stdlib json.
+        report_json = "{\n" + ",\n".join(
+            f'"{k}": {v.model_dump_json(indent=2)}' for k, v in report.items()
+        ) + "\n}"
         return f"""
 
 ### {analyst_name} Report
 ```json
-{json.dumps(serializable_report, indent=2)}
+{report_json}
 ```
 
 """
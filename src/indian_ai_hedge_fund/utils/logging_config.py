@@ -14,6 +14,11 @@ def setup_logging():
     # Remove default handler
     logger.remove()
 
+    # diagnose=True reprs every local variable in each traceback frame —
+    # expensive on error-heavy paths and prone to leaking secrets (API keys,
+    # tokens) into log files. Keep it opt-in, and only for the error sink.
+    diagnose = os.getenv("IAIHF_LOG_DIAGNOSE", "").lower() in ("1", "true", "yes")
+
     # # Add console handler with custom format
     # logger.add(
     #     sys.stderr,
@@ -30,8 +35,10 @@ def setup_logging():
         compression="zip",  # Compress rotated logs
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
         level="DEBUG",
-        backtrace=True,
-        diagnose=True,
+        backtrace=False,
+        diagnose=False,
+        enqueue=True,  # Hand records to a background writer; callers never block on disk
+        delay=True,  # Don't create the file until the first record arrives
     )
 
     # Add file handler for errors only
@@ -42,8 +49,10 @@ def setup_logging():
         compression="zip",
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
         level="ERROR",
-        backtrace=True,
-        diagnose=True,
+        backtrace=diagnose,
+        diagnose=diagnose,
+        enqueue=True,
+        delay=True,
     )
 
     return logger
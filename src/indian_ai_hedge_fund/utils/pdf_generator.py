@@ -1,92 +1,215 @@
+import functools
 import logging
+import os
 import re # Import regular expression module
 from datetime import datetime
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table as ReportlabTable, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib.enums import TA_JUSTIFY, TA_LEFT, TA_CENTER, TA_RIGHT
-from reportlab.lib import colors
-from reportlab.lib.units import inch
+from types import SimpleNamespace
 import pandas as pd
 from typing import List, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# Markdown-ish substitutions applied to string reports, compiled once
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+
+# Preferred holdings columns, in display order
+_PREFERRED_HOLDING_KEYS = ('tradingsymbol', 'quantity', 'average_price', 'last_price', 'pnl')
+
+# Header markup is static — precompute the strings once. The Paragraphs
+# themselves must stay per-report: reportlab mutates flowable state during
+# layout, so sharing Paragraph instances across builds is unsafe.
+_HEADER_MARKUP = {col: f"<b>{col}</b>" for col in _PREFERRED_HOLDING_KEYS}
+_ANALYST_HEADER_MARKUP = ("<b>Ticker</b>", "<b>Signal</b>", "<b>Confidence (%)</b>", "<b>Reasoning</b>")
+
+# Above this row count the holdings table is emitted as chunked tables of
+# plain strings (no per-cell Paragraph flowables) to bound memory and layout
+# cost; see the large-table branch in generate_pdf_report.
+_LARGE_TABLE_ROWS = 1000
+_TABLE_CHUNK_ROWS = 500
+
+_NL_TRANS = str.maketrans({'\n': '<br/>'})
+
+
+def _nl_to_br(s: str) -> str:
+    """Newline-to-<br/> for table cells. The containment check is a C-level
+    scan, so the common newline-free cell (numbers, tickers) skips the string
+    allocation that an unconditional replace() would pay."""
+    return s.translate(_NL_TRANS) if '\n' in s else s
+
+
+@functools.lru_cache(maxsize=4096)
+def _analyst_cell_text(raw: str) -> str:
+    """Memoized cell-text preprocessing for analyst rows. Deterministic
+    analysts often repeat the same signal/reasoning verbatim across tickers;
+    caching the processed string skips the scan-and-translate for repeats.
+    Paragraph objects themselves cannot be cached — wrap() mutates their
+    draw state — so each cell still gets a fresh Paragraph around the
+    shared string."""
+    return _nl_to_br(raw)
+
+
+@functools.lru_cache(maxsize=None)
+def _toolkit() -> SimpleNamespace:
+    """Import reportlab and build the shared PDF machinery on first use.
+
+    reportlab's import graph is heavy (font registration alone is
+    measurable), so runs that never generate a PDF shouldn't pay for it at
+    module import. The lru_cache ensures the stylesheet and table styles are
+    built exactly once per process.
+    """
+    from reportlab import rl_config
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, XPreformatted
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_JUSTIFY
+    from reportlab.lib import colors
+    from reportlab.lib.units import inch
+
+    # shapeChecking makes reportlab validate every attribute assignment on
+    # every flowable; with one Paragraph per table cell those checks dominate
+    # build time. Disabled by default; set IAIHF_PDF_SHAPE_CHECKING=1 when
+    # debugging flowable construction.
+    if os.getenv("IAIHF_PDF_SHAPE_CHECKING", "").lower() not in ("1", "true", "yes"):
+        rl_config.shapeChecking = 0
+
+    styles = getSampleStyleSheet()
+    body = styles['BodyText']
+    return SimpleNamespace(
+        SimpleDocTemplate=SimpleDocTemplate,
+        Paragraph=Paragraph,
+        Spacer=Spacer,
+        Table=Table,
+        XPreformatted=XPreformatted,
+        inch=inch,
+        normal=styles['Normal'],
+        body=body,
+        h1=styles['h1'],
+        h2=styles['h2'],
+        h3=styles['h3'],
+        # Dedicated justified body style: mutating the shared BodyText
+        # alignment per report would leak into every later paragraph now that
+        # the sheet is shared.
+        body_justified=ParagraphStyle('BodyJustified', parent=body, alignment=TA_JUSTIFY),
+        # Table styles are identical for every report — build the command
+        # lists once. setStyle copies the commands into the table, so sharing
+        # these is safe.
+        holdings_table_style=TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ]),
+        analyst_table_style=TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),
+            ('GRID', (0, 0), (-1, -1), 1, colors.darkgrey),
+            ('ALIGN', (3, 1), (3, -1), 'LEFT'), # Align Reasoning left
+        ]),
+    )
+
 # --- PDF Generation Function ---
 
 def generate_pdf_report(holdings_data: Any, analyst_reports: Dict[str, Any], final_synthesis: str | None, filename: str):
     """Generates a PDF report with holdings, analyst reports, and final synthesis."""
     logger.info(f"Generating PDF report: {filename}")
-    doc = SimpleDocTemplate(filename)
-    styles = getSampleStyleSheet()
+    rl = _toolkit()
+    Paragraph = rl.Paragraph
+    Spacer = rl.Spacer
+    ReportlabTable = rl.Table
+    inch = rl.inch
+    normal_style = rl.normal
+    body_style = rl.body
+
+    doc = rl.SimpleDocTemplate(filename)
     story = []
 
     # --- Title ---
     title = "Indian AI Hedge Fund Analysis Report"
-    story.append(Paragraph(title, styles['h1']))
+    story.append(Paragraph(title, rl.h1))
     story.append(Spacer(1, 0.2*inch))
     report_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    story.append(Paragraph(f"Report generated on: {report_date}", styles['Normal']))
+    story.append(Paragraph(f"Report generated on: {report_date}", normal_style))
     story.append(Spacer(1, 0.3*inch))
 
     # --- Holdings ---
-    story.append(Paragraph("Current Portfolio Holdings", styles['h2']))
+    story.append(Paragraph("Current Portfolio Holdings", rl.h2))
     story.append(Spacer(1, 0.1*inch))
 
     holdings_table_data = []
     if isinstance(holdings_data, pd.DataFrame) and not holdings_data.empty:
         # Select a subset of columns for the PDF report
-        pdf_columns = ['tradingsymbol', 'quantity', 'average_price', 'last_price', 'pnl']
-        display_columns = [col for col in pdf_columns if col in holdings_data.columns]
+        display_columns = [col for col in _PREFERRED_HOLDING_KEYS if col in holdings_data.columns]
 
         if not display_columns:
-             holdings_table_data.append([Paragraph("Relevant holding columns not found.", styles['Normal'])])
+             holdings_table_data.append([Paragraph("Relevant holding columns not found.", normal_style)])
         else:
-            # Prepare header row with selected columns
-            headers = [Paragraph(f"<b>{col}</b>", styles['Normal']) for col in display_columns]
-            holdings_table_data.append(headers)
-            # Add data rows for selected columns
-            for index, row in holdings_data[display_columns].iterrows():
-                holdings_table_data.append([Paragraph(str(item).replace('\n', '<br/>'), styles['Normal']) for item in row])
+            # Add data rows for selected columns. Bulk astype(str) converts
+            # every cell in C, and iterating the object ndarray avoids the
+            # per-row Series boxing that iterrows() pays.
+            cells = holdings_data[display_columns].astype(str).to_numpy()
+
+            if len(cells) > _LARGE_TABLE_ROWS:
+                # Very large holdings: one giant table of Paragraph cells
+                # holds every flowable alive at once and its layout cost grows
+                # superlinearly. Emit chunked tables of plain strings instead —
+                # reportlab draws bare strings directly with no per-cell
+                # flowable object, keeping peak memory proportional to one
+                # chunk rather than the whole table.
+                header_row = list(display_columns)
+                for start in range(0, len(cells), _TABLE_CHUNK_ROWS):
+                    chunk_rows = [header_row] + cells[start:start + _TABLE_CHUNK_ROWS].tolist()
+                    chunk_table = ReportlabTable(chunk_rows, hAlign='LEFT', repeatRows=1)
+                    chunk_table.setStyle(rl.holdings_table_style)
+                    story.append(chunk_table)
+                holdings_table_data = None # Already written to the story
+            else:
+                # Prepare header row with selected columns
+                headers = [Paragraph(_HEADER_MARKUP[col], normal_style) for col in display_columns]
+                holdings_table_data.append(headers)
+                for row in cells:
+                    holdings_table_data.append([Paragraph(_nl_to_br(item), normal_style) for item in row])
 
     elif isinstance(holdings_data, list) and holdings_data:
         # Attempt to handle list of dicts, but might be less reliable without known keys
         if isinstance(holdings_data[0], dict):
             # Try to find common keys or a subset - this is less robust
             # For simplicity, maybe just show the first few keys or specific known ones
-            potential_keys = list(holdings_data[0].keys())
+            potential_keys = holdings_data[0].keys() # dict view: O(1) membership tests
             # Example: Prioritize similar keys if found
-            list_keys_subset = [k for k in ['tradingsymbol', 'quantity', 'average_price', 'last_price', 'pnl'] if k in potential_keys]
+            list_keys_subset = tuple(k for k in _PREFERRED_HOLDING_KEYS if k in potential_keys)
             if not list_keys_subset:
-                 list_keys_subset = potential_keys[:5] # Fallback: first 5 keys
+                 list_keys_subset = tuple(potential_keys)[:5] # Fallback: first 5 keys
 
             if list_keys_subset:
-                headers = [Paragraph(f"<b>{key}</b>", styles['Normal']) for key in list_keys_subset]
+                headers = [Paragraph(_HEADER_MARKUP.get(key) or f"<b>{key}</b>", normal_style) for key in list_keys_subset]
                 holdings_table_data.append(headers)
                 for item_dict in holdings_data:
-                     holdings_table_data.append([Paragraph(str(item_dict.get(key, 'N/A')).replace('\n', '<br/>'), styles['Normal']) for key in list_keys_subset])
+                     holdings_table_data.append([Paragraph(_nl_to_br(str(item_dict.get(key, 'N/A'))), normal_style) for key in list_keys_subset])
             else:
-                 holdings_table_data.append([Paragraph("Could not determine columns for list data.", styles['Normal'])])
+                 holdings_table_data.append([Paragraph("Could not determine columns for list data.", normal_style)])
         else:
             # Fallback for simple list - no headers, single column
-            holdings_table_data.append([Paragraph("<b>Value</b>", styles['Normal'])]) # Add a generic header
+            holdings_table_data.append([Paragraph("<b>Value</b>", normal_style)]) # Add a generic header
             for item in holdings_data:
-                 holdings_table_data.append([Paragraph(str(item).replace('\n', '<br/>'), styles['Normal'])])
+                 holdings_table_data.append([Paragraph(_nl_to_br(str(item)), normal_style)])
     else:
          # Added a case for when holdings_data is None or empty non-list/df
-         holdings_table_data.append([Paragraph("No holdings data available or in an unrecognized format.", styles['Normal'])])
+         holdings_table_data.append([Paragraph("No holdings data available or in an unrecognized format.", normal_style)])
 
 
-    if len(holdings_table_data) > 1: # Check if there's more than just the header or placeholder
+    if holdings_table_data is None:
+        pass # Large holdings were already emitted as chunked tables above
+    elif len(holdings_table_data) > 1: # Check if there's more than just the header or placeholder
         holdings_table = ReportlabTable(holdings_table_data, hAlign='LEFT')
-        holdings_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        del holdings_table_data
+        holdings_table.setStyle(rl.holdings_table_style)
         story.append(holdings_table)
     else:
         # Display the placeholder message if table is empty/invalid
@@ -95,83 +218,88 @@ def generate_pdf_report(holdings_data: Any, analyst_reports: Dict[str, Any], fin
     story.append(Spacer(1, 0.3*inch))
 
     # --- Analyst Reports ---
-    story.append(Paragraph("Individual Analyst Reports", styles['h2']))
+    story.append(Paragraph("Individual Analyst Reports", rl.h2))
     story.append(Spacer(1, 0.1*inch))
 
     if analyst_reports:
         for name, report in analyst_reports.items():
-            story.append(Paragraph(f"Report from {name}", styles['h3']))
+            story.append(Paragraph(f"Report from {name}", rl.h3))
             story.append(Spacer(1, 0.05*inch))
             if isinstance(report, dict):
                 # Format dict reports (like Technical Analyst) as a table
                 report_table_data = []
                 # Header Row
-                headers = ["Ticker", "Signal", "Confidence (%)", "Reasoning"]
-                report_table_data.append([Paragraph(f"<b>{h}</b>", styles['Normal']) for h in headers])
-                # Data Rows
+                report_table_data.append([Paragraph(markup, normal_style) for markup in _ANALYST_HEADER_MARKUP])
+                # Data Rows — bind the hot names as locals so the loop body
+                # runs on LOAD_FAST instead of global/attribute lookups
+                P = Paragraph
+                normal = normal_style
+                body = body_style
+                append_row = report_table_data.append
+                cell_text = _analyst_cell_text
                 for ticker, analysis in report.items():
                     signal = getattr(analysis, 'signal', 'N/A')
                     confidence = getattr(analysis, 'confidence', 'N/A')
                     reasoning = getattr(analysis, 'reasoning', 'N/A')
                     conf_str = f"{confidence:.1f}" if isinstance(confidence, (float, int)) else str(confidence)
                     # Replace \n with <br/> for table cell paragraphs
-                    report_table_data.append([
-                        Paragraph(str(ticker).replace('\n', '<br/>'), styles['Normal']),
-                        Paragraph(str(signal).replace('\n', '<br/>'), styles['Normal']),
-                        Paragraph(conf_str.replace('\n', '<br/>'), styles['Normal']),
-                        Paragraph(str(reasoning).replace('\n', '<br/>'), styles['BodyText']) # Use BodyText for longer reasoning
+                    append_row([
+                        P(cell_text(str(ticker)), normal),
+                        P(cell_text(str(signal)), normal),
+                        P(cell_text(conf_str), normal),
+                        P(cell_text(str(reasoning)), body) # Use BodyText for longer reasoning
                     ])
 
-                if len(report_table_data) > 1:
+                rows = len(report_table_data)
+                if rows > 1:
                     report_table = ReportlabTable(report_table_data, colWidths=[1*inch, 1*inch, 1*inch, 3.5*inch], hAlign='LEFT')
-                    report_table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-                        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-                        ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),
-                        ('GRID', (0, 0), (-1, -1), 1, colors.darkgrey),
-                        ('ALIGN', (3, 1), (3, -1), 'LEFT'), # Align Reasoning left
-                    ]))
+                    # The table holds its own cell references; drop ours so the
+                    # outer list isn't kept alive for every analyst at once
+                    del report_table_data
+                    report_table.setStyle(rl.analyst_table_style)
                     story.append(report_table)
                 else:
-                    story.append(Paragraph("Report data is empty.", styles['Normal']))
+                    story.append(Paragraph("Report data is empty.", normal_style))
 
             elif isinstance(report, str):
-                # Handle string reports - use Paragraph with justification
-                # Replace markdown-like elements using regex for proper tag matching
-                report_text = report.replace('\n', '<br/>')
-                report_text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', report_text) # Handle **bold**
-                # Add more substitutions here if needed (e.g., for *italic*)
-                p = Paragraph(report_text, styles['BodyText'])
-                p.style.alignment = TA_JUSTIFY
+                # Handle string reports. Paragraph runs its mini-XML parser
+                # over the whole text, which dominates for multi-KB reports;
+                # text without any markup can go through XPreformatted, which
+                # renders raw lines (newlines intact) and skips the parser.
+                if '**' not in report and '<' not in report:
+                    p = rl.XPreformatted(report, rl.body_justified)
+                else:
+                    # Replace markdown-like elements using regex for proper tag matching
+                    report_text = report.replace('\n', '<br/>')
+                    if '**' in report_text: # Cheap scan saves a full regex pass on plain text
+                        report_text = _BOLD_RE.sub(r'<b>\1</b>', report_text) # Handle **bold**
+                    # Add more substitutions here if needed (e.g., for *italic*)
+                    p = Paragraph(report_text, rl.body_justified)
                 story.append(p)
             else:
                 # Fallback for other types
-                story.append(Paragraph(str(report), styles['Normal']))
+                story.append(Paragraph(str(report), normal_style))
 
             story.append(Spacer(1, 0.2*inch))
     else:
-        story.append(Paragraph("No analyst reports were generated or available.", styles['Normal']))
+        story.append(Paragraph("No analyst reports were generated or available.", normal_style))
 
     story.append(Spacer(1, 0.3*inch))
 
     # --- Final Synthesis ---
-    story.append(Paragraph("Synthesized Analysis Results", styles['h2']))
+    story.append(Paragraph("Synthesized Analysis Results", rl.h2))
     story.append(Spacer(1, 0.1*inch))
 
     if final_synthesis:
         # Replace newlines and basic markdown for PDF paragraphs using regex
         synthesis_text = final_synthesis.replace('\n', '<br/>')
-        synthesis_text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', synthesis_text) # Handle **bold**
+        if '**' in synthesis_text:
+            synthesis_text = _BOLD_RE.sub(r'<b>\1</b>', synthesis_text) # Handle **bold**
         # Add more substitutions here if needed
-        p = Paragraph(synthesis_text, styles['BodyText'])
-        p.style.alignment = TA_JUSTIFY
+        p = Paragraph(synthesis_text, rl.body_justified)
         story.append(p)
     else:
-        story.append(Paragraph("Final synthesis was not generated (possibly due to errors).", styles['Normal']))
+        story.append(Paragraph("Final synthesis was not generated (possibly due to errors).", normal_style))
 
     # --- Build PDF ---
     try:
@@ -182,4 +310,4 @@ def generate_pdf_report(holdings_data: Any, analyst_reports: Dict[str, Any], fin
         # Consider specific error handling or logging details here
         raise # Re-raise the exception to be caught in main
 
-# --- End PDF Generation Function ---
\ No newline at end of file
+# --- End PDF Generation Function ---
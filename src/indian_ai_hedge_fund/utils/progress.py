@@ -7,6 +7,14 @@ import traceback
 
 console = Console()
 
+# Styles are immutable render attributes — build each once instead of
+# reconstructing them on every status line
+_STYLE_RUNNING = Style(color="yellow")
+_STYLE_DONE = Style(color="green", bold=True)
+_STYLE_ERROR = Style(color="red", bold=True)
+_STYLE_NAME = Style(bold=True)
+_STYLE_TICKER = Style(color="cyan")
+
 
 class AgentProgress:
     """Manages progress tracking for multiple agents using simple print statements."""
@@ -17,6 +25,9 @@ class AgentProgress:
         self.started = False
         # Keep track of the last printed lines per agent to potentially overwrite
         self._last_lines: Dict[str, int] = {}
+        # Memoized padded display names; recomputing the replace/title/pad
+        # chain for every update of a busy agent is pure churn
+        self._display_names: Dict[str, str] = {}
 
     def start(self):
         """Indicate that progress tracking has started."""
@@ -38,34 +49,34 @@ class AgentProgress:
 
     def update_status(self, agent_name: str, ticker: Optional[str] = None, status: str = ""):
         """Update and print the status of an agent."""
-        with self.lock:
-            if not self.started:
-                # Don't print if not started, prevents premature messages
-                return
+        if not self.started:
+            # Don't print if not started, prevents premature messages
+            return
 
-            try:
-                # Ensure agent entry exists
-                if agent_name not in self.agent_status:
-                    self.agent_status[agent_name] = {"status": "", "ticker": None}
+        try:
+            # Per-agent state lives in its own dict and CPython dict get/set
+            # are atomic under the GIL, so updates here don't need the lock —
+            # agents only contend on the actual console write in _print_status.
+            info = self.agent_status.setdefault(agent_name, {"status": "", "ticker": None})
 
-                # Update specific fields
-                current_ticker = self.agent_status[agent_name].get("ticker")
-                current_status = self.agent_status[agent_name].get("status", "")
+            # Update specific fields
+            current_ticker = info.get("ticker")
+            current_status = info.get("status", "")
 
-                new_ticker = ticker if ticker is not None else current_ticker
-                new_status = status if status else current_status
+            new_ticker = ticker if ticker is not None else current_ticker
+            new_status = status if status else current_status
 
-                # Only print if something actually changed
-                if new_ticker != current_ticker or new_status != current_status:
-                    self.agent_status[agent_name]["ticker"] = new_ticker
-                    self.agent_status[agent_name]["status"] = new_status
+            # Only print if something actually changed
+            if new_ticker != current_ticker or new_status != current_status:
+                info["ticker"] = new_ticker
+                info["status"] = new_status
 
-                    # Format and print the update
-                    self._print_status(agent_name)
+                # Format and print the update
+                self._print_status(agent_name)
 
-            except Exception as e:
-                console.print(f"[red]Error updating/printing status for {agent_name}: {str(e)}[/red]")
-                # traceback.print_exc() # Optional: more detailed error logging
+        except Exception as e:
+            console.print(f"[red]Error updating/printing status for {agent_name}: {str(e)}[/red]")
+            # traceback.print_exc() # Optional: more detailed error logging
 
     def _print_status(self, agent_name: str):
         """Formats and prints the status for a specific agent."""
@@ -81,27 +92,32 @@ class AgentProgress:
              return
 
         symbol = "⋯"
-        style = Style(color="yellow")
-        if status.lower() == "done" or "complete" in status.lower():
-            style = Style(color="green", bold=True)
+        style = _STYLE_RUNNING
+        status_lower = status.lower()  # lower() allocates; do it once
+        if status_lower == "done" or "complete" in status_lower:
+            style = _STYLE_DONE
             symbol = "✓"
-        elif "error" in status.lower():
-            style = Style(color="red", bold=True)
+        elif "error" in status_lower:
+            style = _STYLE_ERROR
             symbol = "✗"
         # Add more specific styling if needed (e.g., for 'fetching', 'analyzing')
 
         # --- Formatting ---
-        agent_display = agent_name.replace("_agent", "").replace("_", " ").title()
+        agent_display = self._display_names.get(agent_name)
+        if agent_display is None:
+            display = agent_name.replace("_agent", "").replace("_", " ").title()
+            agent_display = self._display_names[agent_name] = f"{display:<25}" # Fixed width for alignment
         status_text = Text()
         status_text.append(f"{symbol} ", style=style)
-        status_text.append(f"{agent_display:<25}", style=Style(bold=True)) # Fixed width for alignment
+        status_text.append(agent_display, style=_STYLE_NAME)
         if ticker:
-            status_text.append(f"[{ticker}] ", style=Style(color="cyan"))
+            status_text.append(f"[{ticker}] ", style=_STYLE_TICKER)
         status_text.append(status, style=style)
 
         # --- Printing ---
-        # Simple print for robustness in threads
-        console.print(status_text)
+        # The console write is the only non-atomic step; serialize just that
+        with self.lock:
+            console.print(status_text)
 
         # --- (Optional) Overwriting logic (might be unstable with threads/agent output) ---
         # line_count = status_text.count('\n') + 1
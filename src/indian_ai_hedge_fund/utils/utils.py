@@ -1,12 +1,30 @@
 import pandas as pd
 
-def prices_to_df(prices: list[list[any]]) -> pd.DataFrame:
+_NUMERIC_PRICE_COLS = ("open", "close", "high", "low", "volume")
+
+def prices_to_df(prices: list[dict[str, any]]) -> pd.DataFrame:
     """Convert prices to a DataFrame."""
-    df = pd.DataFrame(prices)
-    df["Date"] = pd.to_datetime(df["date"])
-    df.set_index("Date", inplace=True)
-    numeric_cols = ["open", "close", "high", "low", "volume"]
-    for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-    df.sort_index(inplace=True)
-    return df
\ No newline at end of file
+    if not prices:
+        return pd.DataFrame()
+    # Extract each field once and coerce it before the DataFrame exists:
+    # assembling from ready typed columns skips object-dtype inference on
+    # construction and the per-column setitem (block manager rebuild) that
+    # pd.to_numeric on a live DataFrame would pay.
+    index = pd.DatetimeIndex([p["date"] for p in prices], name="Date")
+    data = {}
+    for col in prices[0]:
+        values = [p.get(col) for p in prices]
+        data[col] = pd.to_numeric(values, errors="coerce") if col in _NUMERIC_PRICE_COLS else values
+    df = pd.DataFrame(data, index=index)
+    # String columns (e.g. a tradingsymbol repeated on every bar) store one
+    # full str object per row under object dtype; category dtype keeps each
+    # distinct value once plus small integer codes. The raw date column is
+    # left alone since its values are unique.
+    for col in df.select_dtypes(include="object").columns:
+        if col != "date":
+            df[col] = df[col].astype("category")
+    # Broker APIs return bars already in chronological order; the monotonic
+    # check is a cheap O(n) scan that lets the common case skip the sort
+    if not index.is_monotonic_increasing:
+        df.sort_index(inplace=True)
+    return df